@@ -4,3 +4,4 @@ from pydantic import BaseModel
 class MetadataModel(BaseModel):
     """Pydantic model for image metadata request."""
     b64_img: str
+    include_pixel_stats: bool = False
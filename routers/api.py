@@ -34,7 +34,8 @@ def img_metadata(request: MetadataModel):
     """Extract metadata from an image.
 
     Args:
-        request (MetadataModel): MetadataModel instance containing the base64-encoded image.
+        request (MetadataModel): MetadataModel instance containing the base64-encoded image
+                                 and whether to include pixel statistics.
 
     Returns:
         Dict: A dictionary containing metadata extracted from the image.
@@ -42,7 +43,7 @@ def img_metadata(request: MetadataModel):
     Raises:
         Exception: If an error occurs during the metadata extraction process."""
     try:                                    
-        return get_image_metadata(b64decode(request.b64_img))
+        return get_image_metadata(b64decode(request.b64_img), request.include_pixel_stats)
     except Exception as e:
         return {"error": f"{e}"}
 
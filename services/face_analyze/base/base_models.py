@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
 from os.path import isfile
-from typing import List, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 from gdown import download
 from numpy import ndarray, float64
 
 from ..commons import constants as C
 from ..commons.folder_utils import get_deepface_home
+import tensorflow as tf
 from tensorflow.keras.backend import int_shape
 from tensorflow.keras.layers import (
     Activation, add, BatchNormalization, Concatenate, Conv2D, Dense, 
@@ -41,15 +42,42 @@ class BaseModel(ABC):
 class AttributeModelBase(BaseModel):
     """Abstract base class for attribute prediction models."""
 
+    @staticmethod
+    def _compile_forward(model: Model, input_shape: Tuple[int, ...] = (224, 224, 3),
+                         preprocess: Optional[Callable[[tf.Tensor], tf.Tensor]] = None
+                         ) -> Callable[[tf.Tensor], tf.Tensor]:
+        """Wrap the forward pass of a model in an XLA-compiled graph. The graph is
+        traced once, but XLA compiles a program for every distinct batch size, so 
+        callers should pad batches to a few bucket sizes. The output is cast to 
+        float32 so that the result does not depend on the mixed precision policy.
+
+        Args:
+            model (Model): Model to wrap.
+            input_shape (Tuple[int, ...], optional): Shape of a single input image. 
+                                                     Defaults to (224, 224, 3).
+            preprocess (Optional[Callable[[tf.Tensor], tf.Tensor]], optional): Operations 
+                applied to the batch inside the graph before the model. Defaults to None.
+
+        Returns:
+            Callable[[tf.Tensor], tf.Tensor]: Compiled forward function."""
+        @tf.function(input_signature=[tf.TensorSpec((None, *input_shape), tf.float32)],
+                     jit_compile=True)
+        def forward(x: tf.Tensor) -> tf.Tensor:
+            if preprocess is not None:
+                x = preprocess(x)
+            return tf.cast(model(x, training=False), tf.float32)
+
+        return forward
+
     @abstractmethod
     def predict(self, img: ndarray) -> Union[ndarray, float64]: 
-        """Predict attributes for a given image.
+        """Predict attributes for a batch of images.
 
         Args:
-            img (ndarray): Input image.
+            img (ndarray): Batch of input images.
 
         Returns:
-            Union[ndarray, float64]: Predicted attributes."""
+            Union[ndarray, float64]: Predicted attributes, one row per image."""
         pass
 
 
@@ -1,25 +1,119 @@
-from typing import Union
+import math
+from functools import partial
+from typing import Callable, Tuple, Union
 
 import numpy as np
 from numba import njit
 
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+
+_ALIGNMENT: int = 32
+
+
+def as_aligned(x: Union[np.ndarray, list], dtype: type = np.float32) -> np.ndarray:
+    """Convert the input to a C-contiguous array whose data is 32-byte aligned,
+    so that the SIMD distance kernels can use aligned AVX2 loads.
+
+    Args:
+        x (Union[np.ndarray, list]): Input vector or matrix.
+        dtype (type, optional): Element type of the result. Defaults to np.float32.
+
+    Returns:
+        np.ndarray: Aligned contiguous array. The input itself is returned if it 
+        already satisfies the layout."""
+    x = np.asarray(x, dtype=dtype)
+    if x.flags.c_contiguous and x.ctypes.data % _ALIGNMENT == 0:
+        return x
+    buffer = np.empty(x.nbytes + _ALIGNMENT, dtype=np.uint8)
+    offset = -buffer.ctypes.data % _ALIGNMENT
+    out = buffer[offset:offset + x.nbytes].view(x.dtype).reshape(x.shape)
+    out[...] = x
+    return out
+
+
+_as_f32 = partial(as_aligned, dtype=np.float32)
+
+
+@njit(cache=True, fastmath=True)
+def _cosine_nb(x: np.ndarray, y: np.ndarray) -> float:
+    """Cosine distance kernel used when SimSIMD is not installed."""
+    xx = yy = xy = 0.0
+    for i in range(x.shape[0]):
+        xi, yi = x[i], y[i]
+        xx += xi * xi
+        yy += yi * yi
+        xy += xi * yi
+    # Same convention as SimSIMD for zero vectors.
+    if xx == 0.0 and yy == 0.0:
+        return 0.0
+    if xx == 0.0 or yy == 0.0:
+        return 1.0
+    return 1.0 - xy / math.sqrt(xx * yy)
+
+
+@njit(cache=True, fastmath=True)
+def _sqeuclidean_nb(x: np.ndarray, y: np.ndarray) -> float:
+    """Squared Euclidean distance kernel used when SimSIMD is not installed."""
+    acc = 0.0
+    for i in range(x.shape[0]):
+        d = x[i] - y[i]
+        acc += d * d
+    return acc
+
+
+@njit(cache=True, fastmath=True)
+def _cdist_nb(source: np.ndarray, test: np.ndarray, cosine: bool) -> np.ndarray:
+    """Pairwise distance kernel used when SimSIMD is not installed."""
+    out = np.empty((source.shape[0], test.shape[0]), dtype=np.float64)
+    for i in range(source.shape[0]):
+        for j in range(test.shape[0]):
+            if cosine:
+                out[i, j] = _cosine_nb(source[i], test[j])
+            else:
+                out[i, j] = _sqeuclidean_nb(source[i], test[j])
+    return out
+
+
+def _cdist(source: np.ndarray, test: np.ndarray, metric: str) -> np.ndarray:
+    """Dispatch a pairwise distance computation to SimSIMD or the Numba kernels.
+
+    Args:
+        source (np.ndarray): Contiguous source matrix of shape (n1, d).
+        test (np.ndarray): Contiguous test matrix of shape (n2, d).
+        metric (str): "cosine" or "sqeuclidean".
+
+    Returns:
+        np.ndarray: Distance matrix of shape (n1, n2)."""
+    if simsimd is not None:
+        return np.asarray(simsimd.cdist(source, test, metric=metric))
+    return _cdist_nb(source.astype(np.float32, copy=False), 
+                     test.astype(np.float32, copy=False), metric == "cosine")
+
+
+if simsimd is None:
+    _cdist_nb(np.ones((1, 2), np.float32), np.ones((1, 2), np.float32), True)
+    _cdist_nb(np.ones((1, 2), np.float32), np.ones((1, 2), np.float32), False)
+
 
 def find_cosine(source: Union[np.ndarray, list], test: Union[np.ndarray, list]) -> np.float64:
-    """Compute the cosine similarity between two vectors.
+    """Compute the cosine distance between two vectors.
 
     Args:
         source (Union[np.ndarray, list]): Source vector.
         test (Union[np.ndarray, list]): Test vector.
 
     Returns:
-        np.float64: Cosine similarity between the two vectors."""
-    if isinstance(source, list):
-        source = np.array(source)
-    if isinstance(test, list):
-        test = np.array(test)
-    return 1 - (np.matmul(np.transpose(source), test) / (np.sqrt(np.sum(np.multiply(source, source))) * np.sqrt(np.sum(np.multiply(test, test)))))
+        np.float64: Cosine distance between the two vectors."""
+    source, test = _as_f32(source), _as_f32(test)
+    if simsimd is not None:
+        return np.float64(simsimd.cosine(source, test))
+    return np.float64(_cosine_nb(source, test))
+
 
-@njit
 def find_euclidean(source: Union[np.ndarray, list], test: Union[np.ndarray, list]) -> np.float64:
     """Compute the Euclidean distance between two vectors.
 
@@ -29,9 +123,142 @@ def find_euclidean(source: Union[np.ndarray, list], test: Union[np.ndarray, list
 
     Returns:
         np.float64: Euclidean distance between the two vectors."""
-    if isinstance(source, list):
-        source = np.array(source)
-    if isinstance(test, list):
-        test = np.array(test)
-    euclidean_distance = source - test
-    return np.sqrt(np.sum(np.multiply(euclidean_distance, euclidean_distance)))
+    source, test = _as_f32(source), _as_f32(test)
+    if simsimd is not None:
+        return np.sqrt(np.float64(simsimd.sqeuclidean(source, test)))
+    return np.sqrt(np.float64(_sqeuclidean_nb(source, test)))
+
+
+def find_pairwise(source: Union[np.ndarray, list], test: Union[np.ndarray, list],
+                  distance_metric: str = "cosine") -> np.ndarray:
+    """Compute the distances between every row of two matrices in one call.
+
+    Args:
+        source (Union[np.ndarray, list]): Source matrix of shape (n1, d).
+        test (Union[np.ndarray, list]): Test matrix of shape (n2, d).
+        distance_metric (str, optional): "cosine", "euclidean" or "euclidean_l2". Defaults to "cosine".
+
+    Returns:
+        np.ndarray: Distance matrix of shape (n1, n2)."""
+    source, test = _as_f32(source), _as_f32(test)
+    if distance_metric == "cosine":
+        return _cdist(source, test, "cosine")
+    if distance_metric == "euclidean_l2":
+        source = _as_f32(source / np.linalg.norm(source, axis=1, keepdims=True))
+        test = _as_f32(test / np.linalg.norm(test, axis=1, keepdims=True))
+    elif distance_metric != "euclidean":
+        raise ValueError(f"unimplemented distance metric - {distance_metric}")
+    return np.sqrt(_cdist(source, test, "sqeuclidean"))
+
+
+def quantize_i8(x: Union[np.ndarray, list]) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetrically quantize vectors to int8 with one scale per vector.
+
+    Args:
+        x (Union[np.ndarray, list]): Vector or matrix with one vector per row.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Quantized int8 matrix and the per-row scales, 
+        so that x ~= q / scale."""
+    x = np.atleast_2d(_as_f32(x))
+    peak = np.max(np.abs(x), axis=1, keepdims=True)
+    with np.errstate(divide="ignore", over="ignore"):
+        scale = np.where(peak > 0, 127.0 / peak, 1.0)
+    # Denormal peaks overflow the scale; such rows are numerically zero.
+    scale[~np.isfinite(scale)] = 1.0
+    return np.round(x * scale).astype(np.int8), scale[:, 0]
+
+
+def find_pairwise_i8(source: np.ndarray, test: np.ndarray, 
+                     distance_metric: str = "cosine") -> np.ndarray:
+    """Compute the distances between every row of two int8-quantized matrices.
+
+    Cosine distance is scale invariant, so the per-vector scales cancel out and the
+    int8 kernels can be used directly. The L2 distance between normalized vectors
+    is derived from it as sqrt(2 * cosine).
+
+    Args:
+        source (np.ndarray): Quantized source matrix of shape (n1, d).
+        test (np.ndarray): Quantized test matrix of shape (n2, d).
+        distance_metric (str, optional): "cosine" or "euclidean_l2". Defaults to "cosine".
+
+    Returns:
+        np.ndarray: Distance matrix of shape (n1, n2)."""
+    distances = _cdist(as_aligned(source, np.int8), as_aligned(test, np.int8), "cosine")
+    if distance_metric == "cosine":
+        return distances
+    if distance_metric == "euclidean_l2":
+        return np.sqrt(2 * np.maximum(distances, 0))
+    raise ValueError(f"unsupported int8 distance metric - {distance_metric}")
+
+
+def find_pairwise_quantized(source: Union[np.ndarray, list], test: Union[np.ndarray, list],
+                            distance_metric: str = "cosine") -> np.ndarray:
+    """Quantize two embedding matrices to int8 and compute their pairwise distances.
+
+    Args:
+        source (Union[np.ndarray, list]): Source matrix of shape (n1, d).
+        test (Union[np.ndarray, list]): Test matrix of shape (n2, d).
+        distance_metric (str, optional): "cosine" or "euclidean_l2". Defaults to "cosine".
+
+    Returns:
+        np.ndarray: Distance matrix of shape (n1, n2)."""
+    (source_q, _), (test_q, _) = quantize_i8(source), quantize_i8(test)
+    return find_pairwise_i8(source_q, test_q, distance_metric)
+
+
+def prepare_pairwise(source: Union[np.ndarray, list],
+                     distance_metric: str = "euclidean") -> Callable[[np.ndarray], np.ndarray]:
+    """Bind a source matrix to `find_pairwise`, so it is converted only once.
+
+    Args:
+        source (Union[np.ndarray, list]): Source matrix of shape (n1, d).
+        distance_metric (str, optional): "cosine", "euclidean" or "euclidean_l2". Defaults to "euclidean".
+
+    Returns:
+        Callable[[np.ndarray], np.ndarray]: Function mapping a test matrix of shape (n2, d) 
+        to the distance matrix of shape (n1, n2)."""
+    return partial(find_pairwise, _as_f32(source), distance_metric=distance_metric)
+
+
+def prepare_pairwise_quantized(source: Union[np.ndarray, list],
+                               distance_metric: str = "cosine") -> Callable[[np.ndarray], np.ndarray]:
+    """Quantize a source matrix once and bind it to `find_pairwise_i8`.
+
+    Args:
+        source (Union[np.ndarray, list]): Source matrix of shape (n1, d).
+        distance_metric (str, optional): "cosine" or "euclidean_l2". Defaults to "cosine".
+
+    Returns:
+        Callable[[np.ndarray], np.ndarray]: Function quantizing a test matrix of shape (n2, d) 
+        and returning the distance matrix of shape (n1, n2)."""
+    source_q, _ = quantize_i8(source)
+
+    def pairwise(test: Union[np.ndarray, list]) -> np.ndarray:
+        test_q, _ = quantize_i8(test)
+        return find_pairwise_i8(source_q, test_q, distance_metric)
+
+    return pairwise
+
+
+_PAIRWISE = {
+    "cosine": partial(prepare_pairwise_quantized, distance_metric="cosine"),
+    "euclidean": partial(prepare_pairwise, distance_metric="euclidean"),
+    "euclidean_l2": partial(prepare_pairwise_quantized, distance_metric="euclidean_l2"),
+}
+
+
+def get_pairwise(distance_metric: str) -> Callable[[np.ndarray], Callable[[np.ndarray], np.ndarray]]:
+    """Get the pairwise distance function of a metric.
+
+    Args:
+        distance_metric (str): "cosine", "euclidean" or "euclidean_l2".
+
+    Returns:
+        Callable[[np.ndarray], Callable[[np.ndarray], np.ndarray]]: Function taking the 
+        source embedding matrix, prepared once, and returning a function that maps a test 
+        matrix to the distance matrix."""
+    try:
+        return _PAIRWISE[distance_metric]
+    except KeyError:
+        raise ValueError(f"unimplemented distance metric - {distance_metric}")
@@ -0,0 +1,99 @@
+from hashlib import blake2b
+from threading import Lock
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+
+from . import functions as F
+
+_MAX_BYTES: int = 64 * 1024 * 1024
+
+
+def _nbytes(embedding: np.ndarray) -> int:
+    """Size of a cached embedding, used to bound the cache by memory."""
+    return embedding.nbytes
+
+
+_cache: Union[LRUCache, TTLCache] = LRUCache(maxsize=_MAX_BYTES, getsizeof=_nbytes)
+_lock = Lock()
+
+
+def configure(max_bytes: int = _MAX_BYTES, ttl: Optional[float] = None) -> None:
+    """Replace the embedding cache, dropping every cached embedding.
+
+    Args:
+        max_bytes (int, optional): Maximum total size of the cached embeddings in bytes. 
+                                   Defaults to 64 MiB.
+        ttl (Optional[float], optional): Time to live of an entry in seconds.
+                                         Defaults to None (entries never expire)."""
+    global _cache
+    with _lock:
+        if ttl is None:
+            _cache = LRUCache(maxsize=max_bytes, getsizeof=_nbytes)
+        else:
+            _cache = TTLCache(maxsize=max_bytes, ttl=ttl, getsizeof=_nbytes)
+
+
+def _key(face: np.ndarray, model_name: str, normalization: str) -> Tuple[bytes, str, str]:
+    """Build the cache key of an aligned face crop.
+
+    Args:
+        face (np.ndarray): Aligned face crop.
+        model_name (str): Name of the recognition model.
+        normalization (str): Type of normalization.
+
+    Returns:
+        Tuple[bytes, str, str]: Digest of the crop pixels, model name and normalization."""
+    digest = blake2b(np.ascontiguousarray(face).tobytes(), digest_size=16).digest()
+    return digest, model_name, normalization
+
+
+def cached_represent(face: np.ndarray, model_name: str = "VGG-Face",
+                     enforce_detection: bool = True, align: bool = True,
+                     normalization: str = "base") -> np.ndarray:
+    """Represent an aligned face crop, reusing the embedding if the crop was seen before.
+
+    Args:
+        face (np.ndarray): Aligned face crop as returned by `extract_faces`.
+        model_name (str, optional): Name of the recognition model. Defaults to "VGG-Face".
+        enforce_detection (bool, optional): Whether to enforce face detection. Defaults to True.
+        align (bool, optional): Whether to align faces. Defaults to True.
+        normalization (str, optional): Type of normalization. Defaults to "base".
+
+    Returns:
+        np.ndarray: Read-only float32 facial embedding, shared between callers."""
+    key = _key(face, model_name, normalization)
+    with _lock:
+        embedding = _cache.get(key)
+    if embedding is None:
+        embedding = np.asarray(F.represent(face, model_name, enforce_detection, "skip",
+                                           align, normalization)[0]["embedding"], 
+                               dtype=np.float32)
+        embedding.flags.writeable = False
+        with _lock:
+            _cache[key] = embedding
+    return embedding
+
+
+def warmup(images: Iterable[Union[str, np.ndarray]], model_name: str = "VGG-Face",
+           enforce_detection: bool = False, align: bool = True,
+           normalization: str = "base") -> int:
+    """Precompute and cache the embeddings of every face found in the given images.
+
+    Args:
+        images (Iterable[Union[str, np.ndarray]]): Image paths or arrays.
+        model_name (str, optional): Name of the recognition model. Defaults to "VGG-Face".
+        enforce_detection (bool, optional): Whether to enforce face detection. Defaults to False.
+        align (bool, optional): Whether to align faces. Defaults to True.
+        normalization (str, optional): Type of normalization. Defaults to "base".
+
+    Returns:
+        int: Number of faces represented."""
+    target_size = F.find_size(model_name)
+    count = 0
+    for img in images:
+        for face, _, _ in F.extract_faces(img, target_size, False, enforce_detection, align):
+            cached_represent(face, model_name, enforce_detection, align, normalization)
+            count += 1
+    return count
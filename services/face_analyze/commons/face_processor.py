@@ -1,4 +1,4 @@
-from typing import Dict, Union
+from typing import Dict, List, Union
 
 import numpy as np
 
@@ -7,56 +7,66 @@ from ..models.face_attributes import EmotionClient, GenderClient, RaceClient
 
 class FaceProcessor:
     @staticmethod
-    def age(predictions) -> Dict[str, int]:
+    def _classify(name: str, labels: List[str],
+                  probabilities: np.ndarray) -> List[Dict[str, Union[Dict[str, float], str]]]:
+        """Turn a batch of class probabilities into per-face scores and dominant labels.
+
+        Args:
+            name (str): Name of the attribute.
+            labels (List[str]): Class labels.
+            probabilities (np.ndarray): Class probabilities of shape (N, C).
+
+        Returns:
+            List[Dict[str, Union[Dict[str, float], str]]]: Processed predictions for each face."""
+        scores = np.round(100 * probabilities, 2).tolist()
+        dominant = np.argmax(probabilities, axis=1).tolist()
+        return [
+            {name: dict(zip(labels, s)), f"dominant_{name}": labels[d]}
+            for s, d in zip(scores, dominant)
+        ]
+
+    @staticmethod
+    def age(predictions) -> List[Dict[str, int]]:
         """Process age predictions.
 
         Args:
-            predictions: Predicted age.
+            predictions: Predicted ages of shape (N,).
 
         Returns:
-            Dict[str, int]: Processed age prediction."""
-        return {"age": int(predictions)}
+            List[Dict[str, int]]: Processed age prediction for each face."""
+        return [{"age": a} for a in np.asarray(predictions).astype(int).tolist()]
 
     @staticmethod
-    def emotion(predictions) -> Dict[str, Union[Dict[str, float], str]]:
+    def emotion(predictions) -> List[Dict[str, Union[Dict[str, float], str]]]:
         """Process emotion predictions.
 
         Args:
-            predictions: Predicted emotion probabilities.
+            predictions: Predicted emotion probabilities of shape (N, C).
 
         Returns:
-            Dict[str, Union[Dict[str, float], str]]: Processed emotion predictions."""
-        _sum = predictions.sum()
-        return {
-            "emotion": {l: round(100 * p / _sum, 2) for l, p in zip(EmotionClient.labels, predictions)},
-            "dominant_emotion": EmotionClient.labels[np.argmax(predictions)]
-        }
+            List[Dict[str, Union[Dict[str, float], str]]]: Processed emotion predictions for each face."""
+        return FaceProcessor._classify("emotion", EmotionClient.labels,
+                                       predictions / predictions.sum(axis=1, keepdims=True))
 
     @staticmethod
-    def gender(predictions) -> Dict[str, Union[Dict[str, float], str]]:
+    def gender(predictions) -> List[Dict[str, Union[Dict[str, float], str]]]:
         """Process gender predictions.
 
         Args:
-            predictions: Predicted gender probabilities.
+            predictions: Predicted gender probabilities of shape (N, C).
 
         Returns:
-            Dict[str, Union[Dict[str, float], str]]: Processed gender predictions."""
-        return {
-            "gender": {l: round(100 * p, 2) for l, p in zip(GenderClient.labels, predictions)},
-            "dominant_gender": GenderClient.labels[np.argmax(predictions)]
-        }         
+            List[Dict[str, Union[Dict[str, float], str]]]: Processed gender predictions for each face."""
+        return FaceProcessor._classify("gender", GenderClient.labels, predictions)
 
     @staticmethod
-    def race(predictions) -> Dict[str, Union[Dict[str, float], str]]:
+    def race(predictions) -> List[Dict[str, Union[Dict[str, float], str]]]:
         """Process race predictions.
 
         Args:
-            predictions: Predicted race probabilities.
+            predictions: Predicted race probabilities of shape (N, C).
 
         Returns:
-            Dict[str, Union[Dict[str, float], str]]: Processed race predictions."""
-        _sum = predictions.sum()
-        return {
-            "race": {l: round(100 * p / _sum, 2) for l, p in zip(RaceClient.labels, predictions)},
-            "dominant_race": RaceClient.labels[np.argmax(predictions)]
-        }
+            List[Dict[str, Union[Dict[str, float], str]]]: Processed race predictions for each face."""
+        return FaceProcessor._classify("race", RaceClient.labels,
+                                       predictions / predictions.sum(axis=1, keepdims=True))
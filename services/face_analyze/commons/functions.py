@@ -1,9 +1,11 @@
+from functools import lru_cache
+from threading import Lock
 from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
+import tensorflow as tf
 from cv2 import COLOR_BGR2GRAY, resize, cvtColor
 from tensorflow.keras.models import Model
-from tensorflow.keras.preprocessing import image
 from numba import njit
 
 from ..models import face_attributes as fa
@@ -11,18 +13,27 @@ from ..models import recognition_models as rm
 from ..detectors.opencv_client import DetectorWrapper
 from ..loaders.image_loader import load_image
 
+_DEVICE: str = "/GPU:0" if tf.config.list_physical_devices("GPU") else "/CPU:0"
 
+# Only the attribute classifiers run in float16; recognition models stay in float32
+# because the verification thresholds are tuned for float32 embeddings.
+_ATTRIBUTE_POLICY: str = "mixed_float16" if _DEVICE.startswith("/GPU") else "float32"
+_BUILD_LOCK = Lock()
+
+
+@lru_cache(maxsize=None)
 def build_model(model_name: str) -> Model:
     """Builds and returns the specified recognition model.
 
+    The model is built once per name, placed on the first GPU when one is 
+    available, and reused by every later call. On GPU the attribute models 
+    (Emotion, Age, Gender, Race) use float16 compute with float32 weights.
+
     Args:
         model_name (str): Name of the recognition model.
 
     Returns:
         Model: Instance of the specified recognition model."""
-    global model_obj
-    if not "model_obj" in globals():
-        model_obj = dict()
     models = {
         "VGG-Face": rm.VggFaceClient,
         "OpenFace": rm.OpenFaceClient,
@@ -38,9 +49,15 @@ def build_model(model_name: str) -> Model:
         "Gender": fa.GenderClient,
         "Race": fa.RaceClient
     }
-    if not model_name in model_obj:
-        model_obj[model_name] = models[model_name]()
-    return model_obj[model_name]
+    attribute = model_name in ("Emotion", "Age", "Gender", "Race")
+    with _BUILD_LOCK, tf.device(_DEVICE):
+        previous = tf.keras.mixed_precision.global_policy()
+        if attribute:
+            tf.keras.mixed_precision.set_global_policy(_ATTRIBUTE_POLICY)
+        try:
+            return models[model_name]()
+        finally:
+            tf.keras.mixed_precision.set_global_policy(previous)
 
 
 @njit
@@ -57,6 +74,25 @@ def l2_normalize(x: Union[np.ndarray, list]) -> np.ndarray:
     return x / np.sqrt(np.sum(np.multiply(x, x)))
 
 
+@njit(cache=True, fastmath=True)
+def to_unit_batch(img: np.ndarray) -> np.ndarray:
+    """Scales an HWC image to [0, 1] as a single-image float32 batch in one pass.
+
+    Args:
+        img (np.ndarray): Contiguous HWC image.
+
+    Returns:
+        np.ndarray: Float32 array of shape (1, H, W, C)."""
+    h, w, c = img.shape
+    out = np.empty((1, h, w, c), dtype=np.float32)
+    scale = np.float32(1.0 / 255.0)
+    for y in range(h):
+        for x in range(w):
+            for k in range(c):
+                out[0, y, x, k] = img[y, x, k] * scale
+    return out
+
+
 def find_threshold(model_name: str, distance_metric: str) -> float:
     """Finds the threshold value based on the model and distance metric.
 
@@ -166,10 +202,12 @@ def represent(img_path: Union[str, np.ndarray], model_name: str = "VGG-Face",
         if len(img.shape) == 4:
             img = img[0]
         if len(img.shape) == 3:
-            img = resize(img, target_size)
-            img = np.expand_dims(img, axis=0)
+            if (img.shape[1], img.shape[0]) != tuple(target_size):
+                img = resize(img, target_size)
+            # Always work on a copy: normalize_input modifies the image in place.
+            img = np.expand_dims(np.array(img, dtype=np.float32), axis=0)
             if img.max() > 1:
-                img = (img.astype(np.float32) / 255.0).astype(np.float32)
+                img /= 255.0
 
         img_objs = [(img, {"x": 0, "y": 0, "w": img.shape[1], "h": img.shape[2]}, 0)]
     
@@ -238,7 +276,9 @@ def extract_faces(img: Union[str, np.ndarray], target_size: tuple = (224, 224),
         if current_img.shape[0:2] != target_size:
             current_img = resize(current_img, target_size)
 
-        img_pixels = np.expand_dims(image.img_to_array(current_img), axis=0) / 255
+        if current_img.ndim == 2:
+            current_img = current_img[..., np.newaxis]
+        img_pixels = to_unit_batch(np.ascontiguousarray(current_img))
         regs = {"x": int(reg[0]), "y": int(reg[1]), "w": int(reg[2]), "h": int(reg[3])}
         extracted_faces.append((img_pixels, regs, confidence))
 
@@ -1,18 +1,39 @@
-from io import BytesIO
-from typing import Any, Dict, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
-from PIL import Image
-from PIL.ExifTags import TAGS, GPSTAGS, IFD
+import tensorflow as tf
 from tensorflow.keras.models import Model
 
-from .commons.distance import find_cosine, find_euclidean
+from .commons.distance import as_aligned, get_pairwise
 from .commons import functions as F
+from .commons.embedding_cache import cached_represent
 from .commons.folder_utils import initialize_folder
 from .commons.face_processor import FaceProcessor
+from .loaders.metadata_loader import get_image_metadata
 
 initialize_folder()
 
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+
+def _pad_to_bucket(faces: np.ndarray) -> np.ndarray:
+    """Zero-pad a face batch to the next power of two, so the XLA-compiled models 
+    only ever see a few distinct batch sizes.
+
+    Args:
+        faces (np.ndarray): Batch of faces.
+
+    Returns:
+        np.ndarray: Padded batch; the first len(faces) rows are the input faces."""
+    bucket = 1 << (len(faces) - 1).bit_length()
+    if bucket == len(faces):
+        return faces
+    padded = np.zeros((bucket, *faces.shape[1:]), dtype=faces.dtype)
+    padded[:len(faces)] = faces
+    return padded
+
+
 def analyze(img: Union[str, np.ndarray], 
             actions: Dict[str, bool] = {"age": True, "emotion": True, "gender": True, "race": True},
             align: bool = True, enforce_detection: bool = True) -> List[Dict[str, Any]]:
@@ -33,26 +54,46 @@ def analyze(img: Union[str, np.ndarray],
     models: Dict[str, Model] = {
         a: F.build_model(a.capitalize()) for a, s in actions.items() if s
     }
-    resp_objects: List[Dict[str, Any]] = []
-    
-    # TODO: Make it parallel
-    for img, region, confidence in img_objs:
-        if img.shape[0] <= 0 or img.shape[1] <= 0: 
+    img_objs = [(i[0], r, c) for i, r, c in img_objs if i.shape[1] > 0 and i.shape[2] > 0]
+    if not img_objs:
+        return []
+
+    faces = tf.convert_to_tensor(_pad_to_bucket(np.stack([i for i, _, _ in img_objs])), 
+                                 dtype=tf.float32)
+    resp_objects: List[Dict[str, Any]] = [
+        {"region": r, "face_confidence": c} for _, r, c in img_objs
+    ]
+
+    futures = {a: _EXECUTOR.submit(m.predict, faces) for a, m in models.items()}
+    for action, future in futures.items():
+        try:
+            predictions = future.result()[:len(resp_objects)]
+        except Exception:
             continue
-        
-        obj = {"region": region, "face_confidence": confidence}
-        
-        for action, model in models.items():
-            try:
-                obj.update(getattr(FaceProcessor, action)(model.predict(img)))
-            except Exception:
-                continue
 
-        resp_objects.append(obj)
+        for obj, result in zip(resp_objects, getattr(FaceProcessor, action)(predictions)):
+            obj.update(result)
 
     return resp_objects
 
 
+def _represent_faces(faces: List[Tuple[np.ndarray, Dict[str, int], float]], model_name: str, 
+                     enforce_detection: bool, align: bool, normalization: str) -> np.ndarray:
+    """Represent every extracted face and stack the embeddings into one matrix.
+
+    Args:
+        faces (List[Tuple[np.ndarray, Dict[str, int], float]]): Faces returned by `extract_faces`.
+        model_name (str): Model to be used for facial recognition.
+        enforce_detection (bool): Whether to enforce face detection.
+        align (bool): Whether to align faces.
+        normalization (str): Type of normalization to be applied.
+
+    Returns:
+        np.ndarray: Aligned float32 embedding matrix with one row per face."""
+    return as_aligned(np.stack([cached_represent(c, model_name, enforce_detection, align, 
+                                                 normalization) for c, _, _ in faces]))
+
+
 def verify(img1: Union[str, np.ndarray], img2: Union[str, np.ndarray], 
            model_name: str = "VGG-Face", distance_metric: str = "cosine", 
            enforce_detection: bool = True, align: bool = True, 
@@ -69,31 +110,32 @@ def verify(img1: Union[str, np.ndarray], img2: Union[str, np.ndarray],
         normalization (str, optional): Type of normalization to be applied. Defaults to "base".
 
     Returns:
-        Dict[str, Any]: Verification result."""
+        Dict[str, Any]: Verification result. When several faces are found, the reported 
+        pair is the closest one or the first pair within the threshold."""
+    prepare = get_pairwise(distance_metric)
+    threshold = F.find_threshold(model_name, distance_metric)
     target_size = F.find_size(model_name)
 
-    distances, regions = [], []
-    for c1, r1, _ in F.extract_faces(img1, target_size, False, enforce_detection, align):
-        for c2, r2, _ in F.extract_faces(img2, target_size, False, enforce_detection, align):
-            repr1 = F.represent(c1, model_name, enforce_detection, "skip", 
-                                align, normalization)[0]["embedding"]
-            repr2 = F.represent(c2, model_name, enforce_detection, "skip", 
-                                align, normalization)[0]["embedding"]
+    faces1 = F.extract_faces(img1, target_size, False, enforce_detection, align)
+    faces2 = F.extract_faces(img2, target_size, False, enforce_detection, align)
 
-            if distance_metric == "cosine":
-                dst = find_cosine(repr1, repr2)
-            elif distance_metric == "euclidean":
-                dst = find_euclidean(repr1, repr2)
-            else:
-                dst = find_euclidean(dst.l2_normalize(repr1), dst.l2_normalize(repr2))
+    dist_fn = prepare(_represent_faces(faces1, model_name, enforce_detection, align, 
+                                       normalization))
 
-            distances.append(dst)
-            regions.append((r1, r2))
+    # Faces of the second image are embedded one at a time; once any pair is 
+    # within the threshold the verdict is known and the rest are skipped.
+    distance, i, j = np.inf, 0, 0
+    for col, face in enumerate(faces2):
+        repr2 = _represent_faces([face], model_name, enforce_detection, align, normalization)
+        distances = dist_fn(repr2)[:, 0]
+        row = int(distances.argmin())
+        if distances[row] < distance:
+            distance, i, j = float(distances[row]), row, col
+        if distance <= threshold:
+            break
+
+    facial_areas = (faces1[i][1], faces2[j][1])
 
-    threshold = F.find_threshold(model_name, distance_metric)
-    distance = min(distances)
-    facial_areas = regions[np.argmin(distances)]
-    
     return {
         "verified": True if distance <= threshold else False,
         "distance": distance,
@@ -102,64 +144,3 @@ def verify(img1: Union[str, np.ndarray], img2: Union[str, np.ndarray],
         "similarity_metric": distance_metric,
         "facial_areas": {"img1": facial_areas[0], "img2": facial_areas[1]}
     }
-
-
-def get_image_metadata(image: bytes) -> Dict[str, Any]:
-    """Extract metadata from an image.
-
-    Args:
-        image (bytes): Image bytes.
-
-    Returns:
-        Dict[str, Any]: Image metadata."""
-    i = Image.open(BytesIO(image))
-    
-    data = {
-        "Summary": {
-            "ImageSize": str(i.size),
-            "FileType": str(i.format),
-            "FormatDescription": i.format_description,
-            "Mode": i.mode,
-            "MIME": str(Image.MIME.get(i.format, None)),
-            "BandNames": str(i.getbands()),
-            "BBox": str(i.getbbox()),
-            "Megapixels": str(round(i.size[0] * i.size[1] / 1000000, 2)),
-            "Extrema": str(i.getextrema()),
-            "HasTransparency": str(i.has_transparency_data),
-            "Readonly": str(i.readonly),
-            "Palette": str(i.palette),
-        }
-    }
-    exif = i.getexif()
-
-    i.close()
-
-    if exif is None:
-        return data
-
-    for k, v in exif.items():
-        try:
-            k = TAGS[k]
-        except KeyError:
-            pass
-        finally:
-            data["Summary"][str(k)] = str(v)
-    
-    for ifd_id in IFD:
-        data[ifd_id.name] = {}
-
-        ifd = exif.get_ifd(ifd_id)
-        if ifd is None:
-            continue
-
-        resolve = GPSTAGS if ifd_id == IFD.GPSInfo else TAGS
-
-        for k, v in ifd.items():
-            try:
-                k = resolve[k]
-            except KeyError:
-                pass
-            finally:
-                data[ifd_id.name][str(k)] = str(v)
-
-    return data
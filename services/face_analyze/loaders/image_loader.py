@@ -4,7 +4,6 @@ from typing import Tuple, Union
 import cv2
 import numpy as np
 from pathlib import Path
-from PIL import Image
 from requests import get
 
 
@@ -16,8 +15,18 @@ def load_base64(uri: str) -> np.ndarray:
 
     Returns:
         np.ndarray: Loaded image as a NumPy array."""
-    return cv2.imdecode(np.fromstring(b64decode(uri.split(",")[1]), np.uint8), 
-                        cv2.IMREAD_COLOR)
+    return decode_image(b64decode(uri.split(",")[1]))
+
+
+def decode_image(data: bytes) -> np.ndarray:
+    """Decodes encoded image bytes with OpenCV without copying them.
+
+    Args:
+        data (bytes): Encoded image bytes.
+
+    Returns:
+        np.ndarray: Decoded BGR image as a NumPy array."""
+    return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
 
 
 def load_image(img: Union[str, np.ndarray]) -> Tuple[np.ndarray, str]:
@@ -35,6 +44,5 @@ def load_image(img: Union[str, np.ndarray]) -> Tuple[np.ndarray, str]:
     if img.startswith("data:image/"):
         return load_base64(img), "base64 encoded string"
     if img.startswith("http"):
-        return (np.array(Image.open(get(img, stream=True, 
-                                        timeout=60).raw).convert("BGR")), img)
+        return decode_image(get(img, timeout=60).content), img
     return cv2.imread(img), img
@@ -0,0 +1,84 @@
+from io import BytesIO
+from typing import Any, Dict
+
+from PIL import Image
+from PIL.ExifTags import TAGS, GPSTAGS, IFD
+
+
+def _read_exif(i: Image.Image) -> Image.Exif:
+    """Read the EXIF data of an opened image without decoding its pixels.
+
+    `PngImageFile.getexif` loads the whole image to look for eXIf chunks placed
+    after the pixel data, so for PNG images that are not loaded yet only the 
+    EXIF chunk found in the header is read.
+
+    Args:
+        i (Image.Image): Opened image.
+
+    Returns:
+        Image.Exif: EXIF data."""
+    if i.format != "PNG" or i.im is not None:
+        return i.getexif()
+    exif = Image.Exif()
+    if "exif" in i.info:
+        exif.load(i.info["exif"])
+    return exif
+
+
+def get_image_metadata(image: bytes, include_pixel_stats: bool = False) -> Dict[str, Any]:
+    """Extract metadata from an image.
+
+    Only the image header is parsed unless pixel statistics are requested.
+    For PNG, only EXIF data stored before the pixel data is reported in that case.
+
+    Args:
+        image (bytes): Image bytes.
+        include_pixel_stats (bool, optional): Whether to include fields that require 
+                                              decoding the pixels (BBox, Extrema). 
+                                              Defaults to False.
+
+    Returns:
+        Dict[str, Any]: Image metadata."""
+    i = Image.open(BytesIO(image))
+    
+    data = {
+        "Summary": {
+            "ImageSize": str(i.size),
+            "FileType": str(i.format),
+            "FormatDescription": i.format_description,
+            "Mode": i.mode,
+            "MIME": str(Image.MIME.get(i.format, None)),
+            "BandNames": str(i.getbands()),
+            "Megapixels": str(round(i.size[0] * i.size[1] / 1000000, 2)),
+            "HasTransparency": str(i.has_transparency_data),
+            "Readonly": str(i.readonly),
+            "Palette": str(i.palette),
+        }
+    }
+
+    if include_pixel_stats:
+        data["Summary"]["BBox"] = str(i.getbbox())
+        data["Summary"]["Extrema"] = str(i.getextrema())
+
+    exif = _read_exif(i)
+
+    i.close()
+
+    if exif is None:
+        return data
+
+    data["Summary"].update({str(TAGS.get(k, k)): str(v) for k, v in exif.items()})
+    
+    for ifd_id in IFD:
+        try:
+            ifd = exif.get_ifd(ifd_id)
+        except KeyError:
+            ifd = None
+        if ifd is None:
+            data[ifd_id.name] = {}
+            continue
+
+        resolve = GPSTAGS if ifd_id == IFD.GPSInfo else TAGS
+        data[ifd_id.name] = {str(resolve.get(k, k)): str(v) for k, v in ifd.items()}
+
+    return data
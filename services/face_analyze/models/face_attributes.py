@@ -1,5 +1,5 @@
-import cv2
 import numpy as np
+import tensorflow as tf
 from tensorflow.keras.layers import (
     Activation, AveragePooling2D, Conv2D, Convolution2D, Dense, 
     Dropout, Flatten, MaxPooling2D
@@ -16,16 +16,17 @@ class ApparentAgeClient(AttributeModelBase):
     def __init__(self) -> None:
         """Initialize the ApparentAgeClient."""
         self.model, self.model_name = self.load_model(), "Age"
+        self.forward = self._compile_forward(self.model)
 
-    def predict(self, img: np.ndarray) -> np.float64:
-        """Predict the apparent age from the input image.
+    def predict(self, img: np.ndarray) -> np.ndarray:
+        """Predict the apparent age from a batch of input images.
 
         Args:
-            img (np.ndarray): Input image.
+            img (np.ndarray): Batch of input images.
 
         Returns:
-            np.float64: Predicted apparent age."""
-        return np.sum(self.model.predict(img, verbose=0)[0, :] * np.array(list(range(0, 101))))
+            np.ndarray: Predicted apparent age for each image."""
+        return np.sum(self.forward(img).numpy() * np.arange(0, 101), axis=1)
 
     def load_model(self, url: str = C.DOWNLOAD_URL_AGE) -> Model:
         """Load the model for apparent age prediction.
@@ -39,7 +40,7 @@ class ApparentAgeClient(AttributeModelBase):
         base_out = Sequential()
         base_out = Convolution2D(101, (1, 1), name="predictions")(model.layers[-4].output)
         base_out = Flatten()(base_out)
-        base_out = Activation("softmax")(base_out)
+        base_out = Activation("softmax", dtype="float32")(base_out)
         age_model = Model(inputs=model.input, outputs=base_out)
         output = get_deepface_home() + C.PATH_WEIGHTS_AGE
         self._download(url, output)
@@ -53,19 +54,29 @@ class EmotionClient(AttributeModelBase):
     def __init__(self):
         """Initialize the EmotionClient."""
         self.model, self.model_name = self.load_model(), "Emotion"
+        self.forward = self._compile_forward(self.model, preprocess=self._to_gray)
 
     def predict(self, img: np.ndarray) -> np.ndarray:
-        """Predict the emotion from the input image.
+        """Predict the emotion from a batch of input images.
+
+        Args:
+            img (np.ndarray): Batch of input images.
+
+        Returns:
+            np.ndarray: Predicted emotion probabilities for each image."""
+        return self.forward(img).numpy()
+
+    @staticmethod
+    def _to_gray(img: tf.Tensor) -> tf.Tensor:
+        """Convert a batch of BGR images to the 48x48 grayscale input of the model.
 
         Args:
-            img (np.ndarray): Input image.
+            img (tf.Tensor): Batch of BGR images.
 
         Returns:
-            np.ndarray: Predicted emotion probabilities."""
-        img_gray = cv2.cvtColor(img[0], cv2.COLOR_BGR2GRAY)
-        img_gray = cv2.resize(img_gray, (48, 48))
-        img_gray = np.expand_dims(img_gray, axis=0)
-        return self.model.predict(img_gray, verbose=0)[0, :]
+            tf.Tensor: Batch of grayscale images."""
+        gray = tf.tensordot(img, tf.constant([0.114, 0.587, 0.299]), axes=1)[..., tf.newaxis]
+        return tf.image.resize(gray, (48, 48))
 
     def load_model(self, url: str = C.DOWNLOAD_URL_EMOTION) -> Sequential:
         """Load the model for emotion prediction.
@@ -90,7 +101,7 @@ class EmotionClient(AttributeModelBase):
         model.add(Dropout(0.2))
         model.add(Dense(1024, activation="relu"))
         model.add(Dropout(0.2))
-        model.add(Dense(num_classes, activation="softmax"))
+        model.add(Dense(num_classes, activation="softmax", dtype="float32"))
         output = get_deepface_home() + C.PATH_WEIGHTS_EMOTION
         self._download(url, output)
         model.load_weights(output)
@@ -103,16 +114,17 @@ class GenderClient(AttributeModelBase):
     def __init__(self):
         """Initialize the GenderClient."""
         self.model, self.model_name = self.load_model(), "Gender"
+        self.forward = self._compile_forward(self.model)
 
     def predict(self, img: np.ndarray) -> np.ndarray:
-        """Predict the gender from the input image.
+        """Predict the gender from a batch of input images.
 
         Args:
-            img (np.ndarray): Input image.
+            img (np.ndarray): Batch of input images.
 
         Returns:
-            np.ndarray: Predicted gender probabilities."""
-        return self.model.predict(img, verbose=0)[0, :]
+            np.ndarray: Predicted gender probabilities for each image."""
+        return self.forward(img).numpy()
 
     def load_model(self, url: str = C.DOWNLOAD_URL_GENDER) -> Model:
         """Load the model for gender prediction.
@@ -126,7 +138,7 @@ class GenderClient(AttributeModelBase):
         base_model_output = Sequential()
         base_model_output = Convolution2D(2, (1, 1), name="predictions")(model.layers[-4].output)
         base_model_output = Flatten()(base_model_output)
-        base_model_output = Activation("softmax")(base_model_output)
+        base_model_output = Activation("softmax", dtype="float32")(base_model_output)
         gender_model = Model(inputs=model.input, outputs=base_model_output)
         output = get_deepface_home() + C.PATH_WEIGHTS_GENDER
         self._download(url, output)
@@ -140,16 +152,17 @@ class RaceClient(AttributeModelBase):
     def __init__(self):
         """Initialize the RaceClient."""
         self.model, self.model_name = self.load_model(), "Race"
+        self.forward = self._compile_forward(self.model)
 
     def predict(self, img: np.ndarray) -> np.ndarray:
-        """Predict the race from the input image.
+        """Predict the race from a batch of input images.
 
         Args:
-            img (np.ndarray): Input image.
+            img (np.ndarray): Batch of input images.
 
         Returns:
-            np.ndarray: Predicted race probabilities."""
-        return self.model.predict(img, verbose=0)[0, :]
+            np.ndarray: Predicted race probabilities for each image."""
+        return self.forward(img).numpy()
 
     def load_model(self, url: str = C.DOWNLOAD_URL_RACE) -> Model:
         """Load the model for race prediction.
@@ -163,7 +176,7 @@ class RaceClient(AttributeModelBase):
         base_model_output = Sequential()
         base_model_output = Convolution2D(6, (1, 1), name="predictions")(model.layers[-4].output)
         base_model_output = Flatten()(base_model_output)
-        base_model_output = Activation("softmax")(base_model_output)
+        base_model_output = Activation("softmax", dtype="float32")(base_model_output)
         race_model = Model(inputs=model.input, outputs=base_model_output)
         output = get_deepface_home() + C.PATH_WEIGHTS_RACE
         self._download(url, output)
@@ -0,0 +1,68 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from services.face_analyze.commons import distance
+from services.face_analyze.commons.distance import (find_pairwise, find_pairwise_quantized, 
+                                                    get_pairwise, quantize_i8)
+
+
+def _embeddings(seed: int, dim: int = 2622, spikes: int = 8) -> np.ndarray:
+    """Peaky, non-negative ReLU-like embeddings resembling VGG-Face outputs."""
+    rng = np.random.default_rng(seed)
+    base = np.maximum(rng.normal(size=(3, dim)), 0)
+    base[:, rng.integers(0, dim, spikes)] *= 20
+    same = np.maximum(base[0] + rng.normal(scale=0.3, size=dim), 0)
+    return np.vstack([base, same]).astype(np.float32)
+
+
+# Bounds the int8 drift well below the VGG-Face thresholds (0.68 cosine, 1.17 euclidean_l2).
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("metric, tolerance", [("cosine", 1e-2), ("euclidean_l2", 2e-2)])
+def test_quantized_matches_float32(seed, metric, tolerance):
+    embeddings = _embeddings(seed)
+    expected = find_pairwise(embeddings, embeddings, metric)
+    actual = find_pairwise_quantized(embeddings, embeddings, metric)
+    np.testing.assert_allclose(actual, expected, atol=tolerance)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_quantized_keeps_identity_order(seed):
+    embeddings = _embeddings(seed)
+    distances = find_pairwise_quantized(embeddings[:1], embeddings[1:], "cosine")[0]
+    # The noisy copy of the first vector (last row) is the closest match.
+    assert distances.argmin() == len(distances) - 1
+
+
+@pytest.mark.parametrize("metric", ["cosine", "euclidean_l2"])
+def test_quantized_zero_vector(metric):
+    embeddings = _embeddings(0)
+    embeddings[1] = 0
+    embeddings[2] = np.finfo(np.float32).smallest_subnormal
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        q, scale = quantize_i8(embeddings)
+        actual = find_pairwise_quantized(embeddings, embeddings, metric)
+    assert np.all(np.isfinite(scale))
+    assert not q[1:3].any()
+    assert np.all(np.isfinite(actual))
+
+
+@pytest.mark.skipif(distance.simsimd is None, reason="simsimd is not installed")
+def test_numba_cosine_matches_simsimd_on_zero_vectors():
+    embeddings = _embeddings(0)
+    embeddings[1] = 0
+    expected = np.asarray(distance.simsimd.cdist(embeddings, embeddings, metric="cosine"))
+    actual = distance._cdist_nb(embeddings, embeddings, True)
+    np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("metric", ["cosine", "euclidean", "euclidean_l2"])
+def test_prepared_source_matches_per_column(metric):
+    embeddings = _embeddings(0)
+    expected = (find_pairwise if metric == "euclidean" else find_pairwise_quantized)(
+        embeddings, embeddings, metric)
+    dist_fn = get_pairwise(metric)(embeddings)
+    actual = np.hstack([dist_fn(embeddings[j:j + 1]) for j in range(len(embeddings))])
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
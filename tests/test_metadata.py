@@ -0,0 +1,39 @@
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from PIL import Image, ImageFile
+
+from services.face_analyze.loaders.metadata_loader import get_image_metadata
+
+
+def _encode(fmt: str, **params) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (400, 300), (10, 20, 30)).save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+def _exif() -> Image.Exif:
+    exif = Image.Exif()
+    exif[0x010F] = "FeelFlow"
+    return exif
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG"])
+@pytest.mark.parametrize("with_exif", [False, True])
+def test_default_call_does_not_decode_pixels(fmt, with_exif):
+    image = _encode(fmt, **({"exif": _exif()} if with_exif else {}))
+    with patch.object(ImageFile.ImageFile, "load", autospec=True,
+                      side_effect=ImageFile.ImageFile.load) as load:
+        data = get_image_metadata(image)
+
+    load.assert_not_called()
+    assert "BBox" not in data["Summary"]
+    if with_exif:
+        assert data["Summary"]["Make"] == "FeelFlow"
+
+
+def test_pixel_stats_are_exact():
+    data = get_image_metadata(_encode("PNG"), include_pixel_stats=True)
+    assert data["Summary"]["BBox"] == str((0, 0, 400, 300))
+    assert data["Summary"]["Extrema"] == str(((10, 10), (20, 20), (30, 30)))